@@ -168,7 +168,7 @@ class AiAPI:
             return d
 
         @with_retries
-        def _http_get_with_requests(url_: str, data: Dict) -> (int, Dict[str, Any], bytes):
+        def _http_get_with_requests(url_: str, data: Dict) -> (int, Dict[str, Any], bytes, Optional[str]):
             time.sleep(.25)
             response = rq.request('POST', url_, data=data)
 
@@ -178,7 +178,22 @@ class AiAPI:
             except Exception:
                 pass
 
-            return response.status_code, data, response_content
+            return response.status_code, data, response_content, response.headers.get('Retry-After')
+
+        def _get_retry_pause(rs_error_: List, default_pause: float = 1, max_pause: float = 30) -> float:
+            """Get the seconds to wait before retrying the failed requests, the
+            longest Retry-After sent by the server or `default_pause` if none was sent.
+            Values that are negative or above `max_pause` are ignored, as the wait blocks the caller
+            """
+            retry_afters: List[float] = []
+            for result in rs_error_:
+                try:
+                    retry_after = float(result[3])
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= retry_after <= max_pause:
+                    retry_afters.append(retry_after)
+            return max(retry_afters) if retry_afters else default_pause
 
         def _http_get_with_requests_parallel(
                 url: List[str], chunk_: List[Dict]
@@ -194,7 +209,7 @@ class AiAPI:
 
             # Another retry
             if rs_error:
-                time.sleep(1)
+                time.sleep(_get_retry_pause(rs_error))
                 new_chunk = [element[1] for element in rs_error]
                 rs_error = []
                 for result in executor.map(_http_get_with_requests, repeat(url), new_chunk):
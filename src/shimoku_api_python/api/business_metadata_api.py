@@ -232,14 +232,16 @@ class BusinessMetadataApi(ABC):
             return
         reports: List[Report] = await app.get_reports()
         sub_paths = [create_normalized_name(sub_path) for sub_path in sub_paths]
-        non_referenced_reports = [report for report in reports
-                                  if report['path'] is not None and
-                                  create_normalized_name(report['path']) not in sub_paths]
+        if not reports:
+            return
+        sub_paths_set = frozenset(sub_paths)
+        reports_with_path = [(create_normalized_name(report['path']), report)
+                             for report in reports if report['path'] is not None]
+        non_referenced_reports = [report for path, report in reports_with_path if path not in sub_paths_set]
         how_many_updates = len(non_referenced_reports)
         tasks = []
         for i, sub_path in enumerate(sub_paths):
-            _reports = [report for report in reports if (report['path'] is not None and
-                        create_normalized_name(report['path']) == create_normalized_name(sub_path))]
+            _reports = [report for path, report in reports_with_path if path == sub_path]
             how_many_updates += len(_reports)
             for report in _reports:
                 tasks.append(app.update_report(uuid=report['id'], pathOrder=i))
@@ -264,6 +266,9 @@ class BusinessMetadataApi(ABC):
         business = await self._get_business_with_warning(uuid=uuid, name=name)
         if not business:
             return
+        if not menu_order:
+            logger.info('No menu paths to reorder')
+            return
         tasks = []
         for i, menu_option in enumerate(menu_order):
             menu_name = menu_option
@@ -39,7 +39,7 @@ class FileMetadataApi:
         :param file_name: name of the file
         :param overwrite: if True, overwrite the file if it already exists
         """
-        if overwrite and file_name in [file['name'] for file in await self._app.get_files()]:
+        if overwrite and any(file['name'] == file_name for file in await self._app.get_files()):
             logger.info(f'Overwriting file {file_name}')
             await self._app.delete_file(name=file_name)
 
@@ -171,7 +171,8 @@ class FileMetadataApi:
 
         batches = [df[i:i+batch_size] for i in range(0, df.shape[0], batch_size)]
         for i, batch in enumerate(batches):
-            self.post_dataframe(file_name=f'{file_name}_batch_{i}', df=batch)
+            # When overwriting, the bulk delete above already removed the old batches, so skip looking them up
+            self.post_dataframe(file_name=f'{file_name}_batch_{i}', df=batch, overwrite=not overwrite)
 
     @async_auto_call_manager(execute=True)
     @logging_before_and_after(logging_level=logger.info)
@@ -184,7 +185,7 @@ class FileMetadataApi:
         """
         files = await self._app.get_files()
         files = [file for file in files if file['name'].startswith(file_name+'_batch_')]
-        files = sorted(files, key=lambda x: int(x['name'].split('_batch_')[1]))
+        files.sort(key=lambda x: int(x['name'].split('_batch_')[1]))
         results = await asyncio.gather(*[self._get_dataframe(file['name']) for file in files])
         return pd.concat(results, ignore_index=True)
 
@@ -827,7 +827,7 @@ class PlotApi:
         :param color_by_value: whether to color the indicator by value
         """
         df = pd.DataFrame(data if isinstance(data, list) else [data])
-        keep_columns = [k for k in df.columns if k in list(Indicator.default_properties.keys())]
+        keep_columns = [k for k in df.columns if k in Indicator.default_properties]
         df = df[keep_columns]
 
         cols_size = report_params.get('cols_size', 12)
@@ -1192,7 +1192,7 @@ class PlotApi:
                     initial_data[field_name] = ''
 
         r_hash, report = await self._get_chart_report(order, InputForm)
-        _, data_set, _ = list((await self._create_data_set(report['id'], initial_data, dump_whole=True)).values())[0]
+        _, data_set, _ = next(iter((await self._create_data_set(report['id'], initial_data, dump_whole=True)).values()))
 
         rds = await report.get_report_data_sets()
         if len(rds) > 1:
@@ -1341,9 +1341,9 @@ class PlotApi:
         if self.reuse_data_sets:
             rd_ids = get_uuids_from_dict(report['properties']['option'])
             if len(rd_ids) == len(y):
-                rep_ds: List[Report.ReportDataSet] = await report.get_report_data_sets()
-                rep_ds = [next((rd for rd in rep_ds if rd['id'] == rd_id), None) for rd_id in rd_ids]
-                if any(rd['dataSetId'] != ds['id'] or
+                rep_ds_by_id = {rd['id']: rd for rd in await report.get_report_data_sets()}
+                rep_ds = [rep_ds_by_id.get(rd_id) for rd_id in rd_ids]
+                if any(not rd or rd['dataSetId'] != ds['id'] or
                        rd['properties']['mapping'] != {'values': ['dateField1', 'intField1'], 'label': 'stringField1'}
                        for rd, ds in zip(rep_ds, data_sets)):
                     rd_ids = None
@@ -1483,10 +1483,10 @@ class PlotApi:
         if self.reuse_data_sets:
             rd_ids = get_uuids_from_dict(report['properties']['option'])
             if len(rd_ids) == len(fields):
-                rep_ds: List[Report.ReportDataSet] = await report.get_report_data_sets()
+                rep_ds_by_id = {rd['id']: rd for rd in await report.get_report_data_sets()}
                 mapped_f = [self._get_field_mapping(field, data_mapping_to_tuples) for field in fields]
                 for i, rd_id in enumerate(rd_ids):
-                    report_data_set = next((rd for rd in rep_ds if rd['id'] == rd_id), None)
+                    report_data_set = rep_ds_by_id.get(rd_id)
                     if not report_data_set or not self._check_mapping_in_report_data_set(report_data_set, mapped_f[i]):
                         rd_ids = None
                         break
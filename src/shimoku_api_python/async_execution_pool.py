@@ -4,7 +4,6 @@ from functools import wraps
 from typing import Optional, Callable, Coroutine, Dict
 import logging
 from IPython.lib import backgroundjobs as bg
-import time
 from shimoku_api_python.execution_logger import logging_before_and_after, log_error
 
 from copy import copy
@@ -78,28 +77,35 @@ def async_auto_call_manager(execute: Optional[bool] = False) -> Callable:
             # IMPORTANT!! Nothing has to be dependent on this code as the sequential execution needs to keep working
             epc.api_client.semaphore = asyncio.Semaphore(epc.api_client.semaphore_limit)
 
-            # if just one task it's the same as sequential
-            if len(epc.task_pool) == 1:
-                task = epc.task_pool[0]
+            try:
+                # if just one task it's the same as sequential
+                if len(epc.task_pool) == 1:
+                    task = epc.task_pool[0]
+                    epc.task_pool.clear()
+                    result = await task
+                    await execute_ending_tasks(epc)
+                    epc.free_context = {}
+                    return result
+
+                task_pool = copy(epc.task_pool)
                 epc.task_pool.clear()
-                result = await task
+                await asyncio.gather(*task_pool)
                 await execute_ending_tasks(epc)
                 epc.free_context = {}
-                return result
-
-            task_pool = copy(epc.task_pool)
-            epc.task_pool.clear()
-            await asyncio.gather(*task_pool)
-            await execute_ending_tasks(epc)
-            epc.free_context = {}
+            finally:
+                # The session is bound to this event loop, so it can't outlive it
+                await epc.api_client.close_session()
 
         #TODO unify this two functions
         async def sequential_task_execution(epc: ExecutionPoolContext, coroutine: Coroutine):
             epc.api_client.semaphore = asyncio.Semaphore(epc.api_client.semaphore_limit)
-            result = await coroutine
-            await execute_ending_tasks(epc)
-            epc.free_context = {}
-            return result
+            try:
+                result = await coroutine
+                await execute_ending_tasks(epc)
+                epc.free_context = {}
+                return result
+            finally:
+                await epc.api_client.close_session()
 
         @wraps(async_func)
         def wrapper(self, *args, **kwargs):
@@ -123,12 +129,11 @@ def async_auto_call_manager(execute: Optional[bool] = False) -> Callable:
                     if len(epc.task_pool) > 0:
                         logger.info('Executing task pool')
                         job = jobs.new(asyncio.run, execute_tasks(epc))
-                        while not job.finished and job.finished is not None:
-                            time.sleep(0.1)
+                        job.join()
 
                     job = jobs.new(asyncio.run, sequential_task_execution(epc, async_func(self, *args, **kwargs)))
-                    while not job.finished and job.finished is not None:
-                        time.sleep(0.1)
+                    # The jobs are threads, joining them blocks until they end instead of polling their state
+                    job.join()
 
                     if job.finished is None:
                         epc.universe.clear()
@@ -74,11 +74,12 @@ class ResourceCache:
                 logger.warning("Resource's json should have an 'items' field")
                 return []
 
+            resource_class, parent, cache, aliases = self._resource_class, self._parent, self._cache, self._aliases
+            alias_field = resource_class.alias_field
             for resource_dict in resources:
-                resource = self._resource_class(db_resource=resource_dict, parent=self._parent)
-                self._cache[resource_dict.get('id')] = resource
+                resource = resource_class(db_resource=resource_dict, parent=parent)
+                cache[resource_dict.get('id')] = resource
 
-                alias_field = self._resource_class.alias_field
                 alias_entry = None
                 if alias_field in resource_dict:
                     alias_entry = resource_dict.get(alias_field)
@@ -86,7 +87,7 @@ class ResourceCache:
                     alias_entry = resource[alias_field[0]].get(alias_field[1])
 
                 if alias_entry:
-                    self._aliases[alias_entry] = resource_dict.get('id')
+                    aliases[alias_entry] = resource_dict.get('id')
 
                 resource.empty_changed_params()
 
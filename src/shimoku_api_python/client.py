@@ -3,10 +3,12 @@ Used as base Mailchimp:
 https://github.com/mailchimp/mailchimp-marketing-python/blob/master/mailchimp_marketing/api_client.py
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 import asyncio
 import datetime
+import json
+from collections import OrderedDict
 import requests
 from tenacity import retry, wait_exponential, stop_after_attempt
 from shimoku_api_python.exceptions import ApiClientError
@@ -52,6 +54,13 @@ class ApiClient(object):
         self.semaphore_limit = 10
         self.semaphore = None
 
+        # sessions shared by the api calls of each event loop, so that the connections are kept alive
+        self.sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+        # raw bodies of the GET requests that had an ETag, to revalidate them instead of downloading them again
+        self.etag_cache_size = 128
+        self.etag_cache: OrderedDict[Tuple[str, str], Tuple[str, str, bool]] = OrderedDict()
+
         # DEFAULTS
         # Api key
         self.api_key: str = ''
@@ -248,6 +257,39 @@ class ApiClient(object):
         logger.error(response)
         raise ApiClientError(response)
 
+    @logging_before_and_after(logging_level=logger.debug)
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the session of the running event loop, creating it if it doesn't exist yet.
+        Reusing it between requests keeps the connections to the API alive. Each loop has its own session,
+        as they can't be shared between loops and the loops of other threads may still be using theirs.
+        """
+        loop = asyncio.get_running_loop()
+        session = self.sessions.get(loop)
+        if session is None or session.closed:
+            session = self.sessions[loop] = aiohttp.ClientSession()
+        return session
+
+    @logging_before_and_after(logging_level=logger.debug)
+    async def close_session(self):
+        """Close the session of the running event loop, if it has been opened"""
+        session = self.sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    @logging_before_and_after(logging_level=logger.debug)
+    def cache_etag_response(self, key: Tuple[str, str], etag: str, body: str, is_json: bool):
+        """Store the raw body of a GET response with its ETag, dropping the least recently used one when full.
+        The body is kept unparsed so that every hit gets a fresh object without copying it.
+        :param key: the url and query params of the request
+        :param etag: the ETag sent by the server
+        :param body: the text of the response
+        :param is_json: whether the body has to be parsed as json
+        """
+        self.etag_cache[key] = (etag, body, is_json)
+        self.etag_cache.move_to_end(key)
+        if len(self.etag_cache) > self.etag_cache_size:
+            self.etag_cache.popitem(last=False)
+
     @logging_before_and_after(logging_level=logger.debug)
     async def request(self, method, url, query_params=None, headers=None, body=None, limit: Optional[int] = None):
         auth = None
@@ -269,45 +311,62 @@ class ApiClient(object):
 
         next_token = None
         data_res = {}
-        async with aiohttp.ClientSession(auth=auth, timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-
-            while True:  # loop until nextToken is None
-
-                aux_url = url
-                if method == 'GET':
-                    aux_url += (f'?nextToken={next_token}' if next_token else f'?limit={limit if limit else 100}')
-
-                logger.debug(f'method:{method}, url: {aux_url}, headers: {headers},'
-                             f'query params: {query_params}, body: {body}')
-
-                async with session.request(method, aux_url, params=query_params, json=body, headers=headers) as res:
-                    self.call_counter += 1
-                    try:
-                        if 'application/json' in res.headers.get('content-type'):
-                            data = await res.json()
-                        else:
-                            data = await res.text()
+        session = self.get_session()
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        while True:  # loop until nextToken is None
+
+            aux_url = url
+            if method == 'GET':
+                aux_url += (f'?nextToken={next_token}' if next_token else f'?limit={limit if limit else 100}')
+
+            logger.debug(f'method:{method}, url: {aux_url}, headers: {headers},'
+                         f'query params: {query_params}, body: {body}')
+
+            request_headers = headers
+            etag_key, cached_response = None, None
+            if method == 'GET':
+                etag_key = (aux_url, str(query_params))
+                cached_response = self.etag_cache.get(etag_key)
+                if cached_response:
+                    request_headers = {**(headers or {}), 'If-None-Match': cached_response[0]}
+
+            async with session.request(method, aux_url, params=query_params, json=body, headers=request_headers,
+                                       auth=auth, timeout=timeout) as res:
+                self.call_counter += 1
+                try:
+                    if res.status == 304 and cached_response:
+                        self.etag_cache.move_to_end(etag_key)
+                        _, body_text, is_json = cached_response
+                        data = json.loads(body_text) if is_json else body_text
+                    else:
+                        is_json = 'application/json' in res.headers.get('content-type')
+                        body_text = await res.text()
+                        data = json.loads(body_text) if is_json else body_text
 
                         if not res.ok:
                             self.raise_api_exception(data)
 
-                        if 'items' in data:
-                            next_token = data.get('nextToken') if not limit else None
-                            if data_res.get('items'):
-                                data_res['items'].extend(data.get('items'))
-                            else:
-                                data_res = data
+                        if etag_key and res.headers.get('ETag'):
+                            self.cache_etag_response(etag_key, res.headers['ETag'], body_text, is_json)
+
+                    if 'items' in data:
+                        next_token = data.get('nextToken') if not limit else None
+                        if data_res.get('items'):
+                            data_res['items'].extend(data.get('items'))
                         else:
                             data_res = data
-                            next_token = None
+                    else:
+                        data_res = data
+                        next_token = None
 
-                        logger.debug(data)
+                    logger.debug(data)
 
-                    except Exception as e:
-                        self.raise_api_exception(str(e))
+                except Exception as e:
+                    self.raise_api_exception(str(e))
 
-                if not next_token:
-                    break
+            if not next_token:
+                break
 
         return data_res
 
@@ -1,4 +1,5 @@
 import datetime as dt
+from operator import itemgetter
 
 import asyncio
 import json
@@ -96,7 +97,8 @@ class Activity(Resource):
             :return: The logs.
             """
             logs = await self._base_resource.get_children(Activity.Run.Log)
-            return sorted(logs, key=lambda log: log['dateTime'])
+            logs.sort(key=itemgetter('dateTime'))
+            return logs
 
         @logging_before_and_after(logging_level=logger.debug)
         async def trigger_webhook(self):
@@ -190,7 +192,8 @@ class Activity(Resource):
 
         await asyncio.gather(*[run.get_logs() for run in runs])
 
-        return sorted(runs, key=runs_ordering)[-how_many_runs:]
+        runs.sort(key=runs_ordering)
+        return runs[-how_many_runs:]
 
     @logging_before_and_after(logging_level=logger.debug)
     async def create_run(self, settings: Optional[Union[Dict, str]] = None) -> 'Activity.Run':
@@ -1,5 +1,6 @@
 from typing import List, Dict, Optional, Type, Tuple, Union, TYPE_CHECKING
 from copy import deepcopy
+from operator import itemgetter
 
 import aiohttp
 import pandas as pd
@@ -113,12 +114,9 @@ class App(Resource):
         """ Gets all the paths of the app. They are stored in the reports. """
         reports = await self.get_reports()
         path_orders = [(report['path'], report['pathOrder']) for report in reports if report['pathOrder'] is not None]
-        path_orders.sort(key=lambda x: x[1])
-        result = []
-        for path_order in path_orders:
-            if path_order[0] not in result:
-                result.append(path_order[0])
-        return result
+        path_orders.sort(key=itemgetter(1))
+        # dict keys keep insertion order, so this deduplicates keeping the first appearance of each path
+        return list(dict.fromkeys(path for path, _ in path_orders))
 
     @logging_before_and_after(logger.debug)
     async def create_report(self, report_class: Type[Report], r_hash: str, **params) -> Report:
@@ -238,10 +236,9 @@ class App(Resource):
             return False
         reports = await self.get_reports()
         report_data_sets_lists = await asyncio.gather(*[report.get_report_data_sets() for report in reports])
-        delete_tasks = []
-        for i, report_data_sets in enumerate(report_data_sets_lists):
-            await asyncio.gather(*[reports[i].delete_report_dataset(rds['id'])
-                                   for rds in report_data_sets if rds['dataSetId'] == data_set['id']])
+        delete_tasks = [report.delete_report_dataset(rds['id'])
+                        for report, report_data_sets in zip(reports, report_data_sets_lists)
+                        for rds in report_data_sets if rds['dataSetId'] == data_set['id']]
 
         await asyncio.gather(*delete_tasks)
         await self.delete_data_set(uuid, name)
@@ -255,11 +252,13 @@ class App(Resource):
         """
         all_reports = await self.get_reports()
         all_rds = await asyncio.gather(*[report.get_report_data_sets() for report in all_reports])
-        all_datasets_in_use = [rds['dataSetId'] for _rds_list in all_rds for rds in _rds_list]
+        all_datasets_in_use = frozenset(rds['dataSetId'] for _rds_list in all_rds for rds in _rds_list)
+        if data_set_ids is not None:
+            data_set_ids = frozenset(data_set_ids)
         all_datasets = await self.get_data_sets()
         dataset_ids_to_delete = [ds['id'] for ds in all_datasets
                                  if ds['id'] not in all_datasets_in_use
-                                 and (ds['id'] in data_set_ids or data_set_ids is None)]
+                                 and (data_set_ids is None or ds['id'] in data_set_ids)]
         await asyncio.gather(*[self._base_resource.delete_child(DataSet, ds_id) for ds_id in dataset_ids_to_delete])
         if log:
             logger.info(f'Deleted {len(dataset_ids_to_delete)} unused datasets from the menu path {str(self)}')
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid1
 from typing import Optional, List, Dict, TYPE_CHECKING
 
@@ -151,9 +152,9 @@ class Business(Resource):
         await self.create_event(EventType.APP_DELETED, {}, app['id'])
         if self.api_client.playground:
             dashboards = await self.get_dashboards()
-            for dashboard in dashboards:
-                if app['id'] in await dashboard.list_app_ids():
-                    await dashboard.remove_app(app)
+            app_ids_lists = await asyncio.gather(*[dashboard.list_app_ids() for dashboard in dashboards])
+            await asyncio.gather(*[dashboard.remove_app(app)
+                                   for dashboard, app_ids in zip(dashboards, app_ids_lists) if app['id'] in app_ids])
         return result
 
     @logging_before_and_after(logger.debug)
@@ -2,6 +2,7 @@ from typing import List, Dict, Optional, Tuple, TYPE_CHECKING, Type
 
 import asyncio
 from copy import deepcopy
+import numpy as np
 import pandas as pd
 import datetime as dt
 import json
@@ -17,6 +18,87 @@ from ..execution_logger import logging_before_and_after
 logger = logging.getLogger(__name__)
 
 
+# Inferred types of the values of a column that can't contain date or datetime values
+_NON_DATE_INFERRED_TYPES = frozenset({
+    'string', 'bytes', 'empty', 'integer', 'floating', 'mixed-integer-float', 'decimal', 'complex', 'boolean',
+    'time', 'timedelta', 'timedelta64', 'period', 'interval',
+})
+
+
+def _date_to_isoformat(value):
+    return value.isoformat() if isinstance(value, dt.date) else value
+
+
+def _utc_offset_to_isoformat(seconds: int) -> str:
+    """ Format a UTC offset the way datetime.isoformat does, +HH:MM or +HH:MM:SS if it has seconds """
+    sign = '-' if seconds < 0 else '+'
+    hours, remainder = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f'{sign}{hours:02d}:{minutes:02d}' + (f':{seconds:02d}' if seconds else '')
+
+
+def _datetime_column_to_isoformat(column: pd.Series) -> np.ndarray:
+    """ Convert a datetime64 column to the same strings Timestamp.isoformat gives, working on the whole column
+    instead of on each value. The fractional seconds and the UTC offsets are only appended where needed.
+    :param column: datetime64 column, naive or timezone aware
+    :return: object array with the isoformat strings, and 'NaT' for the missing values
+    """
+    tz = column.dt.tz
+    local = column.dt.tz_localize(None) if tz is not None else column
+    values = local.to_numpy()
+    is_nat = np.isnat(values)
+    isoformat = np.datetime_as_string(values, unit='s').astype(object)
+
+    microseconds = np.where(is_nat, 0, local.dt.microsecond.to_numpy()).astype(np.int64)
+    nanoseconds = np.where(is_nat, 0, local.dt.nanosecond.to_numpy()).astype(np.int64)
+    with_nanoseconds = nanoseconds != 0
+    with_microseconds = (microseconds != 0) & ~with_nanoseconds
+    if with_microseconds.any():
+        isoformat[with_microseconds] += np.char.mod('.%06d', microseconds[with_microseconds]).astype(object)
+    if with_nanoseconds.any():
+        isoformat[with_nanoseconds] += np.char.mod(
+            '.%09d', microseconds[with_nanoseconds] * 1000 + nanoseconds[with_nanoseconds]).astype(object)
+
+    if tz is not None:
+        # A column has few distinct offsets, so only those are formatted
+        utc_values = column.dt.tz_convert(None).to_numpy()
+        offsets = ((values[~is_nat] - utc_values[~is_nat]) // np.timedelta64(1, 's')).astype(np.int64)
+        unique_offsets, offset_indices = np.unique(offsets, return_inverse=True)
+        offset_strings = np.array([_utc_offset_to_isoformat(int(offset)) for offset in unique_offsets], dtype=object)
+        isoformat[~is_nat] += offset_strings[offset_indices]
+
+    isoformat[is_nat] = 'NaT'
+    return isoformat
+
+
+@logging_before_and_after(logging_level=logger.debug)
+def convert_dates_to_isoformat(df: pd.DataFrame) -> pd.DataFrame:
+    """ Convert the date and datetime values of a dataframe to isoformat strings. The datetime64 columns are
+    converted as a whole, the other columns are only rewritten value by value if their inferred type shows
+    that they hold dates, and numeric and boolean columns are skipped. Columns are accessed by position, so
+    duplicated labels are supported.
+    :param df: dataframe to convert
+    :return: a copy of the dataframe with the dates converted, or the same dataframe if nothing had to change
+    """
+    converted_df = df
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_numeric_dtype(dtype):
+            continue
+        column = df.iloc[:, i]
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            values = _datetime_column_to_isoformat(column)
+        else:
+            candidates = column.cat.categories if isinstance(dtype, pd.CategoricalDtype) else column
+            if pd.api.types.infer_dtype(candidates, skipna=True) in _NON_DATE_INFERRED_TYPES:
+                continue
+            values = [_date_to_isoformat(v) for v in column]
+
+        if converted_df is df:
+            converted_df = df.copy()
+        converted_df.isetitem(i, pd.Series(values, index=df.index, dtype=object))
+    return converted_df
+
+
 @logging_before_and_after(logging_level=logger.debug)
 def convert_dataframe_to_report_entry(
     df: pd.DataFrame,
@@ -28,6 +110,7 @@ def convert_dataframe_to_report_entry(
     :param sorting_columns_map:
     :param report_entry_chunks:
     """
+    df = convert_dates_to_isoformat(df)
 
     if sorting_columns_map:
         try:
@@ -38,59 +121,83 @@ def convert_dataframe_to_report_entry(
                 f'You provided {len(sorting_columns_map)} | '
                 f'You provided {sorting_columns_map}'
             )
-        df_ = df.rename(columns=sorting_columns_map)
-        metadata_entries: List[Dict] = df_[list(sorting_columns_map.values())].to_dict(orient='records')
+        sorting_fields = list(sorting_columns_map.values())
+        metadata_entries: List[Dict] = [
+            dict(zip(sorting_fields, row))
+            for row in df[list(sorting_columns_map.keys())].itertuples(index=False, name=None)
+        ]
     else:
         metadata_entries: List[Dict] = []
 
     records: List[Dict] = df.to_dict(orient='records')
 
     if report_entry_chunks:
-        for datum in records:
-            for k, v in datum.items():
-                if isinstance(v, dt.date) or isinstance(v, dt.datetime):
-                    datum[k] = v.isoformat()
         data_entries = [{'data': d} for d in records]
     else:
-        try:
-            data_entries: List[Dict] = [
-                {'data': json.dumps(d)}
-                for d in records
-            ]
-        except TypeError:
-            # If we have date or datetime values
-            # then we need to convert them to isoformat
-            for datum in records:
-                for k, v in datum.items():
-                    if isinstance(v, dt.date) or isinstance(v, dt.datetime):
-                        datum[k] = v.isoformat()
-
-            data_entries: List[Dict] = [
-                {'data': json.dumps(d)}
-                for d in records
-            ]
+        # Dates are already in isoformat, so every record can be serialized in a single pass
+        dumps = json.dumps
+        data_entries: List[Dict] = [{'data': dumps(d)} for d in records]
 
     if metadata_entries:
-        try:
-            _ = json.dumps(metadata_entries)
-        except TypeError:
-            # If we have date or datetime values
-            # then we need to convert them to isoformat
-            for datum in metadata_entries:
-                for k, v in datum.items():
-                    if isinstance(v, dt.date) or isinstance(v, dt.datetime):
-                        datum[k] = v.isoformat()
-
         # Generate the list of single entries with all
         # necessary information to be posted
         return [
-            {**data_entry, **metadata_entry}
+            data_entry | metadata_entry
             for data_entry, metadata_entry in zip(data_entries, metadata_entries)
         ]
     else:
         return data_entries
 
 
+def copy_default_properties(default_properties: Dict) -> Dict:
+    """ Copy the default properties of a report class. The defaults are mostly scalars and empty containers, so
+    the containers are shallow copied and only the non-empty ones go through deepcopy.
+    :param default_properties: the default properties of a report class
+    :return: an independent copy of the default properties
+    """
+    properties = {}
+    for property_name, value in default_properties.items():
+        if isinstance(value, (dict, list)):
+            value = deepcopy(value) if value else value.copy()
+        properties[property_name] = value
+    return properties
+
+
+_report_classes_by_type: Optional[Dict[Optional[str], Type['Report']]] = None
+
+
+def _get_report_classes_by_type() -> Dict[Optional[str], Type['Report']]:
+    """ Get the report class for each report type. The map is built on the first call, as the report classes
+    import this module and can't be imported at load time.
+    :return: dictionary from report type to report class
+    """
+    global _report_classes_by_type
+    if _report_classes_by_type is None:
+        from .reports.tabs_group import TabsGroup
+        from .reports.modal import Modal
+        from .reports.charts.indicator import Indicator
+        from .reports.charts.echart import EChart
+        from .reports.charts.iframe import IFrame
+        from .reports.charts.html import HTML
+        from .reports.charts.table import Table
+        from .reports.charts.annotated_chart import AnnotatedEChart
+        from .reports.charts.button import Button
+        from .reports.charts.input_form import InputForm
+        from .reports.filter_data_set import FilterDataSet
+        from .reports.unsupported import Unsupported
+
+        report_classes_by_type = {
+            report_class.report_type: report_class
+            for report_class in [TabsGroup, Modal, Indicator, EChart, IFrame, HTML, Table,
+                                 AnnotatedEChart, Button, InputForm, FilterDataSet]
+        }
+        report_classes_by_type.update({
+            report_type: Unsupported for report_type in ['INDICATORS', 'MULTIFILTER', 'ECHARTS', None]
+        })
+        _report_classes_by_type = report_classes_by_type
+    return _report_classes_by_type
+
+
 class Report(Resource):
     """ Report resource class """
 
@@ -170,7 +277,7 @@ class Report(Resource):
             sizeRows=3,
             sizePadding='0,0,0,0',
             bentobox={},
-            properties=deepcopy(self.default_properties),
+            properties=copy_default_properties(self.default_properties),
             dataFields={},
             chartData=[],
             # subscribed=False,
@@ -196,44 +303,10 @@ class Report(Resource):
         if cls is Report:
             if db_resource is None:
                 raise ValueError('You must provide a db_resource to create a Report instance')
-            if db_resource['reportType'] == 'TABS':
-                from .reports.tabs_group import TabsGroup
-                return TabsGroup(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'MODAL':
-                from .reports.modal import Modal
-                return Modal(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'INDICATOR':
-                from .reports.charts.indicator import Indicator
-                return Indicator(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'ECHARTS2':
-                from .reports.charts.echart import EChart
-                return EChart(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'IFRAME':
-                from .reports.charts.iframe import IFrame
-                return IFrame(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'HTML':
-                from .reports.charts.html import HTML
-                return HTML(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'TABLE':
-                from .reports.charts.table import Table
-                return Table(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'ANNOTATED_ECHART':
-                from .reports.charts.annotated_chart import AnnotatedEChart
-                return AnnotatedEChart(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'BUTTON':
-                from .reports.charts.button import Button
-                return Button(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'FORM':
-                from .reports.charts.input_form import InputForm
-                return InputForm(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] == 'FILTERDATASET':
-                from .reports.filter_data_set import FilterDataSet
-                return FilterDataSet(parent=parent, uuid=uuid, db_resource=db_resource)
-            elif db_resource['reportType'] in ['INDICATORS', 'MULTIFILTER', 'ECHARTS', None]:
-                from .reports.unsupported import Unsupported
-                return Unsupported(parent=parent, uuid=uuid, db_resource=db_resource)
-            else:
+            report_class = _get_report_classes_by_type().get(db_resource['reportType'])
+            if report_class is None:
                 raise ValueError(f'Unknown report type {db_resource["reportType"]}')
+            return report_class(parent=parent, uuid=uuid, db_resource=db_resource)
         else:
             return super().__new__(cls)
 
@@ -251,10 +324,11 @@ class Report(Resource):
     def set_properties(self, **properties):
         """ Set the properties of the report without saving it to the server ç
         :param properties: the properties to set """
+        default_properties, possible_values = self.default_properties, self.possible_values
         for property_name, value in properties.items():
-            if property_name not in self.default_properties.keys():
+            if property_name not in default_properties:
                 raise ValueError(f'Property {property_name} is not a possible property for {self.report_type}')
-            if property_name in self.possible_values and value not in self.possible_values[property_name]:
+            if property_name in possible_values and value not in possible_values[property_name]:
                 raise ValueError(f'Value {value} is not a possible value for property {property_name}')
 
         self['properties'].update(properties)
@@ -269,7 +343,7 @@ class Report(Resource):
         await self.delete_report_data_sets()
         self['reportType'] = report_class.report_type
         r_hash = self['properties'].get('hash')
-        self['properties'] = deepcopy(report_class.default_properties)
+        self['properties'] = copy_default_properties(report_class.default_properties)
         self['properties']['hash'] = r_hash
         self['dataFields'] = {}
         self['chartData'] = []
@@ -79,7 +79,7 @@ def get_common_echart_options() -> Dict[str, Any]:
     # if bottom_toolbox:
     #     del toolbox_options['top']
     #     toolbox_options['bottom'] = "0px"
-    return deepcopy({
+    return {
         'legend': {
             'show': True,
             'type': 'scroll',
@@ -90,7 +90,7 @@ def get_common_echart_options() -> Dict[str, Any]:
             'trigger': 'item',
             'axisPointer': {'type': 'cross'},
         },
-        'toolbox': default_toolbox_options,
+        'toolbox': deepcopy(default_toolbox_options),
         'xAxis': [{
             'data': '#set_data#',
             'type': 'category',
@@ -110,13 +110,13 @@ def get_common_echart_options() -> Dict[str, Any]:
             'bottom': 48,
             'containLabel': True
         },
-    })
+    }
 
 
 def get_common_series_options() -> Dict[str, Any]:
-    return deepcopy({
+    return {
         'data': '#set_data#',
         'emphasis': {'focus': 'series'},
         'smooth': True,
         'itemStyle': {'borderRadius': [9, 9, 0, 0]},
-    })
+    }
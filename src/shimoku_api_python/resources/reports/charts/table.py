@@ -27,19 +27,20 @@ class Table(Report):
 def interpret_label_map(values: list[str], label_map: Union[str, List, tuple], variant: str):
     options = []
     color_def = interpret_color(label_map)
+    # The chip colors only depend on the label map, so they are computed once for all the values
+    chip_colors = {'backgroundColor': color_def}
+    if variant == 'outlined':
+        chip_colors['color'] = color_def
+    elif color_def.startswith('#'):
+        chip_colors['color'] = '#000000' if (int(color_def[1:3], 16) * 0.299 +
+                                             int(color_def[3:5], 16) * 0.587 +
+                                             int(color_def[5:7], 16) * 0.114) > 186 else '#ffffff'
     for val in values:
         if isinstance(val, float) and int(val) - val == 0:
             val = int(val)
         if not isinstance(val, str) and not isinstance(val, int) and not isinstance(val, dt.datetime):
             val = float(val)
-        label_options = {'value': val, 'backgroundColor': color_def}
-        if variant == 'outlined':
-            label_options['color'] = color_def
-        elif color_def.startswith('#'):
-            label_options['color'] = '#000000' if (int(color_def[1:3], 16) * 0.299 +
-                                                   int(color_def[3:5], 16) * 0.587 +
-                                                   int(color_def[5:7], 16) * 0.114) > 186 else '#ffffff'
-        options.append(label_options)
+        options.append({'value': val, **chip_colors})
     return options
 
 
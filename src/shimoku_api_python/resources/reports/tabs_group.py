@@ -92,17 +92,18 @@ class TabsGroup(Report):
         """ Change tabs order without saving it to the server
         :param tabs: list of tabs in the new order
         """
-        all_tabs = list(self['properties']['tabs'].keys())
+        tabs_by_name = self['properties']['tabs']
 
         for i, tab in enumerate(tabs):
-            if tab not in self['properties']['tabs']:
+            if tab not in tabs_by_name:
                 logger.warning(f"Tab {tab} not found")
                 continue
-            all_tabs.remove(tab)
-            self['properties']['tabs'][tab]['order'] = i
+            tabs_by_name[tab]['order'] = i
 
-        for i, tab in enumerate(all_tabs):
-            self['properties']['tabs'][tab]['order'] = i + len(tabs)
+        ordered_tabs = set(tabs)
+        remaining_tabs = [tab for tab in tabs_by_name if tab not in ordered_tabs]
+        for i, tab in enumerate(remaining_tabs):
+            tabs_by_name[tab]['order'] = i + len(tabs)
         self.dirty = True
 
     @logging_before_and_after(logger.debug)
@@ -7,6 +7,7 @@ from typing import Optional, List, Union, Type, Callable
 import graphene
 from dataclasses import field
 from functools import partial
+from operator import attrgetter
 
 
 class AccountExposedList(graphene.ObjectType):
@@ -793,7 +794,7 @@ class DataExposed(graphene.ObjectType):
         if sort is not None and sort.field is not None and sort.direction is not None:
             sort_direction = sort.direction.value
             sort_field = sort.field.value
-            items = sorted(items, key=lambda x: getattr(x, sort_field), reverse=sort_direction == 'desc')
+            items = sorted(items, key=attrgetter(sort_field), reverse=sort_direction == 'desc')
         if filter is not None:
             items = DataExposed.filter(items, filter)
         return items
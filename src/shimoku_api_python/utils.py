@@ -15,6 +15,13 @@ from shimoku_api_python.execution_logger import logging_before_and_after, log_er
 
 logger = logging.getLogger(__name__)
 
+# Translation table that removes every character allowed in a name, whatever remains is invalid
+_REMOVE_ALLOWED_NAME_CHARS = str.maketrans(
+    '', '', 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._- &$'
+)
+# Translation table that strips the characters json5 can't parse from raw javascript options
+_REMOVE_JS_SEPARATORS = str.maketrans('', '', '\n;')
+
 
 def create_normalized_name(name: str) -> str:
     """Having a name create a normalizedName
@@ -24,8 +31,7 @@ def create_normalized_name(name: str) -> str:
     # "name": "   Test Borrar_grafico    "
     # "normalizedName": "test-borrar-grafico"
     """
-    if any([c not in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._- &$'
-            for c in name.encode('ascii', 'ignore').decode()]):
+    if name.encode('ascii', 'ignore').decode().translate(_REMOVE_ALLOWED_NAME_CHARS):
         log_error(logger,
                   f'You can only use letters, numbers, spaces, "-" and "_" in your name | '
                   f'you introduced {name}',
@@ -134,66 +140,73 @@ def convert_data_and_get_series_name(data: pd.DataFrame, field: str) -> Tuple[pd
     return converted_data, series_name
 
 
+def _get_uuids(container: Union[dict, list]) -> List[str]:
+    """ Get all uuids from a nested dictionary or list, walking it with a stack of iterators instead of recursion
+    so that the order of the uuids is kept. They follow the pattern '#{'id'}'. """
+    uuids = []
+    stack = [iter(container.values() if isinstance(container, dict) else container)]
+    while stack:
+        for v in stack[-1]:
+            # Most values are leaves, and the placeholders are always plain strings written by the SDK
+            if type(v) is str:
+                if v[:2] == '#{' and v[-1:] == '}':
+                    uuids.append(v[2:-1])
+            elif isinstance(v, dict):
+                stack.append(iter(v.values()))
+                break
+            elif isinstance(v, list):
+                stack.append(iter(v))
+                break
+        else:
+            stack.pop()
+    return uuids
+
+
 @logging_before_and_after(logging_level=logger.debug)
 def get_uuids_from_dict(_dict: dict) -> List[str]:
     """ Get all uuids from a dictionary. They follow the pattern '#{'id'}'. """
-    uuids = []
-    for k, v in _dict.items():
-        if isinstance(v, dict):
-            uuids.extend(get_uuids_from_dict(v))
-        elif isinstance(v, list):
-            uuids.extend(get_uuids_from_list(v))
-        elif isinstance(v, str) and v.startswith('#{') and v.endswith('}'):
-            uuids.append(v[2:-1])
-    return uuids
+    return _get_uuids(_dict)
 
 
 @logging_before_and_after(logging_level=logger.debug)
 def get_uuids_from_list(_list: list) -> List[str]:
     """ Get all uuids from a list. They follow the pattern '#{'id'}'. """
-    uuids = []
-    for v in _list:
-        if isinstance(v, dict):
-            uuids.extend(get_uuids_from_dict(v))
-        elif isinstance(v, list):
-            uuids.extend(get_uuids_from_list(v))
-        elif isinstance(v, str) and v.startswith('#{') and v.endswith('}'):
-            uuids.append(v[2:-1])
-    return uuids
+    return _get_uuids(_list)
+
+
+def _get_data_references(container: Union[dict, list], previous_keys: List[Union[str, int]]) -> List[List[str]]:
+    """ Get the paths of all data references from a nested dictionary or list, walking it with a stack of
+    (iterator, path) pairs instead of recursion. They follow the pattern '#set_data#'. """
+    entries = []
+    stack = [(iter(container.items() if isinstance(container, dict) else enumerate(container)), previous_keys)]
+    while stack:
+        items, keys = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), keys + [k]))
+                break
+            elif isinstance(v, list):
+                stack.append((iter(enumerate(v)), keys + [k]))
+                break
+            elif v == '#set_data#':
+                entries.append(keys + [k])
+        else:
+            stack.pop()
+    return entries
 
 
 @logging_before_and_after(logging_level=logger.debug)
 def get_data_references_from_dict(_dict: dict, previous_keys: Optional[List[Union[str, int]]] = None) -> \
         List[List[str]]:
     """ Get all data references from a dictionary. They follow the pattern '#set_data#'. """
-    if previous_keys is None:
-        previous_keys = []
-    entries = []
-    for k, v in _dict.items():
-        if isinstance(v, dict):
-            entries.extend(get_data_references_from_dict(v, previous_keys=previous_keys + [k]))
-        elif isinstance(v, list):
-            entries.extend(get_data_references_from_list(v, previous_keys=previous_keys + [k]))
-        elif v == '#set_data#':
-            entries.append(previous_keys + [k])
-    return entries
+    return _get_data_references(_dict, previous_keys if previous_keys is not None else [])
 
 
 @logging_before_and_after(logging_level=logger.debug)
 def get_data_references_from_list(_list: list, previous_keys: Optional[List[Union[int, str]]] = None
                                   ) -> List[List[str]]:
     """ Get all data references from a list. They follow the pattern '#set_data#'. """
-    if previous_keys is None:
-        previous_keys = []
-    entries = []
-    for i, v in enumerate(_list):
-        if isinstance(v, dict):
-            entries.extend(get_data_references_from_dict(v, previous_keys=previous_keys + [i]))
-        elif isinstance(v, list):
-            entries.extend(get_data_references_from_list(v, previous_keys=previous_keys + [i]))
-        elif v == '#set_data#':
-            entries.append(previous_keys + [i])
-    return entries
+    return _get_data_references(_list, previous_keys if previous_keys is not None else [])
 
 
 @logging_before_and_after(logging_level=logger.debug)
@@ -457,9 +470,7 @@ def interpret_color(color_def: Union[List, str, int]) -> Union[str, Dict]:
 @logging_before_and_after(logging_level=logger.debug)
 def transform_dict_js_to_py(options_str: str):
     """https://discuss.dizzycoding.com/how-to-convert-raw-javascript-object-to-python-dictionary/"""
-    options_str = options_str.replace('\n', '')
-    options_str = options_str.replace(';', '')
-    return json5.loads(options_str)
+    return json5.loads(options_str.translate(_REMOVE_JS_SEPARATORS))
 
 
 @logging_before_and_after(logging_level=logger.debug)
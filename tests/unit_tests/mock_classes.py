@@ -56,6 +56,10 @@ class MockApiClient:
 
         return body_params
 
+    @logging_before_and_after(logging_level=logger.debug)
+    async def close_session(self):
+        """ MOCK. There is no session to close """
+
 
 class MockClient(Client):
     """ Mock Client class """
@@ -0,0 +1,107 @@
+""""""
+import asyncio
+import json
+import unittest
+from typing import Dict, List, Optional
+
+from shimoku_api_python.client import ApiClient
+
+
+class FakeResponse:
+    """ Response returned by the fake session, only with what ApiClient.request reads """
+
+    def __init__(self, status: int, body: Optional[Dict] = None, etag: Optional[str] = None):
+        self.status = status
+        self.ok = status < 400
+        self.body = json.dumps(body) if body is not None else ''
+        self.headers = {'content-type': 'application/json'} if body is not None else {}
+        if etag:
+            self.headers['ETag'] = etag
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """ Session that answers with the queued responses and records the sent headers """
+
+    closed = False
+
+    def __init__(self, responses: List[FakeResponse]):
+        self.responses = responses
+        self.sent: List[Dict] = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append({'url': url, 'headers': headers or {}})
+        return self.responses.pop(0)
+
+
+class TestApiClientETag(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = ApiClient(environment='production', playground=False, config={'api_key': 'key-server'})
+
+    def request(self, responses: List[FakeResponse], url: str = 'http://test/items') -> (Dict, FakeSession):
+        session = FakeSession(responses)
+
+        async def _request():
+            loop = asyncio.get_running_loop()
+            self.api_client.sessions[loop] = session
+            try:
+                return await self.api_client.request('GET', url)
+            finally:
+                self.api_client.sessions.pop(loop)
+
+        return asyncio.run(_request()), session
+
+    def test_not_modified_returns_cached_body(self):
+        page = {'items': [{'id': 1}, {'id': 2}]}
+        first, session = self.request([FakeResponse(200, page, etag='"v1"')])
+        self.assertEqual(first, page)
+        self.assertNotIn('If-None-Match', session.sent[0]['headers'])
+
+        first['items'].append({'id': 3})
+
+        second, session = self.request([FakeResponse(304)])
+        self.assertEqual(session.sent[0]['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(second, page)
+        self.assertIsNot(second, first)
+
+    def test_responses_without_etag_are_not_cached(self):
+        self.request([FakeResponse(200, {'items': []})])
+        self.assertEqual(len(self.api_client.etag_cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        self.api_client.etag_cache_size = 2
+        for name in ['a', 'b']:
+            self.request([FakeResponse(200, {'name': name}, etag=name)], url=f'http://test/{name}')
+        # Revalidating 'a' makes 'b' the least recently used one
+        self.request([FakeResponse(304)], url='http://test/a')
+        self.request([FakeResponse(200, {'name': 'c'}, etag='c')], url='http://test/c')
+
+        cached_urls = [url for url, _ in self.api_client.etag_cache]
+        self.assertEqual(cached_urls, ['http://test/a?limit=100', 'http://test/c?limit=100'])
+
+    def test_pagination_with_cached_page(self):
+        first_page = {'items': [{'id': 1}], 'nextToken': 'token'}
+        second_page = {'items': [{'id': 2}]}
+        expected = {'items': [{'id': 1}, {'id': 2}], 'nextToken': 'token'}
+
+        result, _ = self.request([FakeResponse(200, first_page, etag='"p1"'), FakeResponse(200, second_page)])
+        self.assertEqual(result, expected)
+
+        for _ in range(2):
+            result, session = self.request([FakeResponse(304), FakeResponse(200, second_page)])
+            self.assertEqual(session.sent[0]['headers']['If-None-Match'], '"p1"')
+            self.assertNotIn('If-None-Match', session.sent[1]['headers'])
+            self.assertEqual(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
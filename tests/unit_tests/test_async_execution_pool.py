@@ -0,0 +1,46 @@
+""""""
+import unittest
+
+import aiohttp
+
+from shimoku_api_python.async_execution_pool import ExecutionPoolContext, async_auto_call_manager
+from shimoku_api_python.client import ApiClient
+
+from mock_classes import MockApiClient
+
+
+class SessionUser:
+    """ Minimal class with an execution pool context, like the ones of the api """
+
+    def __init__(self, api_client):
+        self.epc = ExecutionPoolContext(api_client)
+
+    @async_auto_call_manager(execute=True)
+    async def get_session(self) -> aiohttp.ClientSession:
+        return self.epc.api_client.get_session()
+
+    @async_auto_call_manager(execute=True)
+    async def query_element(self):
+        return await self.epc.api_client.query_element('GET', 'business/id')
+
+
+class TestAsyncAutoCallManager(unittest.TestCase):
+
+    def test_session_is_closed_when_the_execution_ends(self):
+        api_client = ApiClient(environment='production', playground=False, config={'api_key': 'key-server'})
+        session_user = SessionUser(api_client)
+
+        first_session = session_user.get_session()
+        second_session = session_user.get_session()
+
+        self.assertTrue(first_session.closed)
+        self.assertTrue(second_session.closed)
+        self.assertIsNot(first_session, second_session)
+        self.assertEqual(api_client.sessions, {})
+
+    def test_mock_api_client(self):
+        self.assertEqual(SessionUser(MockApiClient()).query_element(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+""""""
+import datetime as dt
+import json
+import unittest
+
+import pandas as pd
+
+from shimoku_api_python.resources.report import convert_dates_to_isoformat, convert_dataframe_to_report_entry
+
+
+class TestConvertDatesToIsoformat(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'object': [dt.date(2023, 1, 1), 'text'],
+            'datetime64': pd.to_datetime(['2023-01-01 10:00', '2023-01-02 11:30']),
+            'tz_aware': pd.to_datetime(['2023-01-01 10:00', '2023-01-02 11:30']).tz_localize('Europe/Madrid'),
+            'categorical': pd.Categorical([dt.date(2023, 1, 1), dt.date(2023, 1, 2)]),
+            'number': [1, 2],
+            'boolean': [True, False],
+        })
+
+    def test_dates_are_converted_in_every_column_that_can_hold_them(self):
+        converted = convert_dates_to_isoformat(self.df)
+
+        self.assertEqual(converted['object'].tolist(), ['2023-01-01', 'text'])
+        self.assertEqual(converted['datetime64'].tolist(), ['2023-01-01T10:00:00', '2023-01-02T11:30:00'])
+        self.assertEqual(converted['tz_aware'].tolist(),
+                         ['2023-01-01T10:00:00+01:00', '2023-01-02T11:30:00+01:00'])
+        self.assertEqual(converted['categorical'].tolist(), ['2023-01-01', '2023-01-02'])
+        self.assertEqual(converted['number'].tolist(), [1, 2])
+        self.assertEqual(converted['boolean'].tolist(), [True, False])
+
+    def test_original_dataframe_is_not_modified(self):
+        convert_dates_to_isoformat(self.df)
+        self.assertIsInstance(self.df['categorical'].dtype, pd.CategoricalDtype)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(self.df['datetime64'].dtype))
+
+    def test_datetime_columns_keep_fractions_offsets_and_missing_values(self):
+        column = pd.Series(pd.to_datetime(
+            ['2023-07-01 10:00:00.5', '2023-12-01 10:00:00.000000001', None, '1969-12-31 23:59:59.25']
+        )).dt.tz_localize('UTC').dt.tz_convert('America/St_Johns')
+        converted = convert_dates_to_isoformat(pd.DataFrame({'date': column}))
+
+        expected = [value.isoformat() for value in column]
+        self.assertEqual(converted['date'].tolist(), expected)
+        self.assertEqual(expected[2], 'NaT')
+
+    def test_duplicated_column_labels(self):
+        df = pd.DataFrame([[1, dt.date(2023, 1, 1)], [2, dt.date(2023, 1, 2)], [3, 'text']], columns=['a', 'a'])
+        converted = convert_dates_to_isoformat(df)
+        self.assertEqual(converted.values.tolist(), [[1, '2023-01-01'], [2, '2023-01-02'], [3, 'text']])
+
+    def test_dataframe_without_dates_is_returned_as_is(self):
+        df = pd.DataFrame({'number': [1, 2], 'boolean': [True, False], 'text': ['a', None],
+                           'categorical': pd.Categorical(['a', 'b'])})
+        self.assertIs(convert_dates_to_isoformat(df), df)
+
+    def test_report_entries_are_serializable(self):
+        entries = convert_dataframe_to_report_entry(self.df)
+        json.dumps(entries)
+
+
+if __name__ == '__main__':
+    unittest.main()